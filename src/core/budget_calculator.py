@@ -6,133 +6,208 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Dict, Any
 
+try:
+    import numexpr
+except ImportError:  # numexpr is optional
+    numexpr = None
+
+# Below this many periods numexpr's setup cost outweighs the fused evaluation
+NUMEXPR_MIN_PERIODS = 1024
+
+# Below this many periods numba's compile time outweighs the compiled receivables loop
+NUMBA_MIN_PERIODS = 1024
+
+# Policy coefficients, in the order they are stored in BudgetCalculator.policy
+POLICY_KEYS = (
+    'sales_collection_current',
+    'sales_collection_next',
+    'purchases_payment_current',
+    'purchases_payment_next',
+    'ending_inventory_pct',
+    'external_financing_ratio',
+    'working_capital_turnover',
+    'beginning_cash'
+)
+(COLLECT_CURRENT, COLLECT_NEXT, PAY_CURRENT, PAY_NEXT,
+ ENDING_INVENTORY, EXTERNAL_FINANCING, WC_TURNOVER, BEGINNING_CASH) = range(len(POLICY_KEYS))
+
+
+def _current_plus_previous(values: np.ndarray, current_pct: float, next_pct: float) -> np.ndarray:
+    """Portion of each period's values settled now plus the previous period's carry-over."""
+    prev = np.empty_like(values)
+    prev[:1] = 0.0
+    prev[1:] = values[:-1]
+    
+    if numexpr is not None and values.shape[0] >= NUMEXPR_MIN_PERIODS:
+        return numexpr.evaluate("values * a + prev * b",
+                                local_dict={'values': values, 'prev': prev, 'a': current_pct, 'b': next_pct})
+    return values * current_pct + prev * next_pct
+
+
+def _receivables_numpy(sales_rev: np.ndarray, collect_current: float, collect_next: float) -> np.ndarray:
+    """Running receivables: new uncollected sales less prior-quarter collections."""
+    prev_rev = np.empty_like(sales_rev)
+    prev_rev[:1] = 0.0
+    prev_rev[1:] = sales_rev[:-1]
+    return np.cumsum(sales_rev * (1.0 - collect_current) - prev_rev * collect_next)
+
+
+def _receivables_loop(sales_rev, collect_current, collect_next):
+    """Running receivables as a plain loop, compiled by numba for long horizons."""
+    receivables = np.empty_like(sales_rev)
+    balance = 0.0
+    for i in range(sales_rev.shape[0]):
+        balance += sales_rev[i] * (1.0 - collect_current)
+        if i > 0:
+            balance -= sales_rev[i - 1] * collect_next
+        receivables[i] = balance
+    return receivables
+
+
+# Compiled _receivables_loop, built on first use; numba is not imported at application startup
+_receivables_jit = None
+_numba_checked = False
+
+
+def _compiled_receivables():
+    """Return the compiled receivables loop, or None if numba is not installed."""
+    global _receivables_jit, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True  # Also remembers a failed import, so it is not retried
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional
+            return None
+        _receivables_jit = njit(cache=True)(_receivables_loop)
+    return _receivables_jit
+
+
+def _receivables(sales_rev: np.ndarray, collect_current: float, collect_next: float) -> np.ndarray:
+    """Running receivables, compiled only for horizons long enough to repay numba's compile time."""
+    if sales_rev.shape[0] >= NUMBA_MIN_PERIODS:
+        compiled = _compiled_receivables()
+        if compiled is not None:
+            return compiled(sales_rev, collect_current, collect_next)
+    return _receivables_numpy(sales_rev, collect_current, collect_next)
+
 
 class BudgetCalculator:
     """Handles all budget-related calculations."""
     
     def __init__(self, settings: Dict[str, float]):
         self.settings = settings
+        # Settings only change by building a new calculator, so parse them once here
+        self.policy = np.array([float(settings[key]) for key in POLICY_KEYS])
     
     def compute_sales_revenue(self, data: pd.DataFrame) -> pd.DataFrame:
         """Compute sales revenue for each quarter."""
         if data is None or data.empty:
             return pd.DataFrame()
         
-        sales_data = data.copy()
-        sales_data['sales_revenue'] = sales_data['sales_units'] * sales_data['unit_price']
-        return sales_data
+        # Only the input columns the schedules use, as plain NumPy arrays
+        sales_units = data['sales_units'].to_numpy()
+        unit_price = data['unit_price'].to_numpy()
+
+        return pd.DataFrame({
+            'quarter': data['quarter'].to_numpy(),
+            'sales_units': sales_units,
+            'unit_price': unit_price,
+            'sales_revenue': sales_units * unit_price
+        }, index=data.index)
     
     def compute_collections(self, sales_data: pd.DataFrame) -> pd.DataFrame:
         """Compute cash collections schedule."""
         if sales_data is None or sales_data.empty:
             return pd.DataFrame()
         
-        collections = sales_data.copy()
-        collections['collections'] = 0.0
-        
-        for i, row in collections.iterrows():
-            current_revenue = row['sales_revenue']
-            
-            # Current quarter collections
-            collections.loc[i, 'collections'] += (current_revenue * 
-                                               self.settings['sales_collection_current'])
-            
-            # Previous quarter collections (if not first quarter)
-            if i > 0:
-                prev_revenue = collections.loc[i-1, 'sales_revenue']
-                collections.loc[i, 'collections'] += (prev_revenue * 
-                                                   self.settings['sales_collection_next'])
-        
-        return collections
+        sales_rev = sales_data['sales_revenue'].to_numpy(dtype=float)
+
+        # Current quarter collections + previous quarter collections
+        collections = _current_plus_previous(sales_rev, self.policy[COLLECT_CURRENT],
+                                             self.policy[COLLECT_NEXT])
+
+        # Units and price are carried through for the cash budget report
+        return pd.DataFrame({
+            'quarter': sales_data['quarter'].to_numpy(),
+            'sales_units': sales_data['sales_units'].to_numpy(),
+            'unit_price': sales_data['unit_price'].to_numpy(),
+            'sales_revenue': sales_data['sales_revenue'].to_numpy(),
+            'collections': collections
+        }, index=sales_data.index)
     
     def compute_purchases(self, sales_data: pd.DataFrame) -> pd.DataFrame:
         """Compute purchases and inventory."""
         if sales_data is None or sales_data.empty:
             return pd.DataFrame()
         
-        purchases = sales_data.copy()
-        purchases['desired_ending_inventory'] = 0.0
-        purchases['beginning_inventory'] = 0.0
-        purchases['purchases_units'] = 0.0
-        purchases['purchases_cost'] = 0.0
-        
+        sales_units = sales_data['sales_units'].to_numpy(dtype=float)
+
         # Assume cost per unit is 60% of selling price
-        cost_per_unit = purchases['unit_price'] * 0.6
-        
-        for i, row in purchases.iterrows():
-            # Desired ending inventory (20% of next quarter's sales)
-            if i < len(purchases) - 1:
-                next_q_sales = purchases.loc[i+1, 'sales_units']
-                purchases.loc[i, 'desired_ending_inventory'] = (next_q_sales * 
-                                                             self.settings['ending_inventory_pct'])
-            
-            # Beginning inventory (ending inventory from previous quarter)
-            if i > 0:
-                purchases.loc[i, 'beginning_inventory'] = purchases.loc[i-1, 'desired_ending_inventory']
-            
-            # Purchases = Sales + Desired Ending Inventory - Beginning Inventory
-            purchases.loc[i, 'purchases_units'] = (row['sales_units'] + 
-                                                 purchases.loc[i, 'desired_ending_inventory'] - 
-                                                 purchases.loc[i, 'beginning_inventory'])
-            
-            # Purchases cost
-            purchases.loc[i, 'purchases_cost'] = (purchases.loc[i, 'purchases_units'] * 
-                                                cost_per_unit.iloc[i])
-        
-        return purchases
+        cost_per_unit = sales_data['unit_price'].to_numpy(dtype=float) * 0.6
+
+        # Desired ending inventory (20% of next quarter's sales, none after the last quarter)
+        desired_end = np.empty_like(sales_units)
+        desired_end[:-1] = sales_units[1:] * self.policy[ENDING_INVENTORY]
+        desired_end[-1:] = 0.0
+
+        # Beginning inventory (ending inventory from previous quarter)
+        beginning_inv = np.empty_like(desired_end)
+        beginning_inv[:1] = 0.0
+        beginning_inv[1:] = desired_end[:-1]
+
+        # Purchases = Sales + Desired Ending Inventory - Beginning Inventory
+        purchases_units = sales_units + desired_end - beginning_inv
+
+        return pd.DataFrame({
+            'quarter': sales_data['quarter'].to_numpy(),
+            'desired_ending_inventory': desired_end,
+            'beginning_inventory': beginning_inv,
+            'purchases_units': purchases_units,
+            'purchases_cost': purchases_units * cost_per_unit
+        }, index=sales_data.index)
     
     def compute_cash_budget(self, collections: pd.DataFrame, purchases: pd.DataFrame) -> pd.DataFrame:
         """Compute cash budget."""
         if collections is None or collections.empty or purchases is None or purchases.empty:
             return pd.DataFrame()
         
-        cash_budget = collections.copy()
-        cash_budget['disbursements'] = 0.0
-        cash_budget['beginning_cash'] = self.settings['beginning_cash']
-        cash_budget['ending_cash'] = 0.0
-        
-        for i, row in cash_budget.iterrows():
-            current_purchases = purchases.loc[i, 'purchases_cost']
-            
-            # Current quarter disbursements
-            cash_budget.loc[i, 'disbursements'] += (current_purchases * 
-                                                  self.settings['purchases_payment_current'])
-            
-            # Previous quarter disbursements (if not first quarter)
-            if i > 0:
-                prev_purchases = purchases.loc[i-1, 'purchases_cost']
-                cash_budget.loc[i, 'disbursements'] += (prev_purchases * 
-                                                      self.settings['purchases_payment_next'])
-            
-            # Cash flow
-            if i == 0:
-                cash_budget.loc[i, 'ending_cash'] = (self.settings['beginning_cash'] + 
-                                                   row['collections'] - 
-                                                   cash_budget.loc[i, 'disbursements'])
-            else:
-                cash_budget.loc[i, 'ending_cash'] = (cash_budget.loc[i-1, 'ending_cash'] + 
-                                                   row['collections'] - 
-                                                   cash_budget.loc[i, 'disbursements'])
-        
-        return cash_budget
+        collected = collections['collections'].to_numpy(dtype=float)
+        purchases_cost = purchases['purchases_cost'].to_numpy(dtype=float)
+
+        # Current quarter disbursements + previous quarter disbursements
+        disbursements = _current_plus_previous(purchases_cost, self.policy[PAY_CURRENT],
+                                               self.policy[PAY_NEXT])
+
+        # Cash flow: running balance of collections less disbursements
+        ending_cash = np.cumsum(collected - disbursements) + self.policy[BEGINNING_CASH]
+
+        return pd.DataFrame({
+            'quarter': collections['quarter'].to_numpy(),
+            'sales_units': collections['sales_units'].to_numpy(),
+            'unit_price': collections['unit_price'].to_numpy(),
+            'sales_revenue': collections['sales_revenue'].to_numpy(),
+            'collections': collected,
+            'disbursements': disbursements,
+            'beginning_cash': self.settings['beginning_cash'],
+            'ending_cash': ending_cash
+        }, index=collections.index)
     
     def compute_income_statement(self, sales_data: pd.DataFrame) -> pd.DataFrame:
         """Compute income statement."""
         if sales_data is None or sales_data.empty:
             return pd.DataFrame()
         
-        income_stmt = pd.DataFrame()
-        income_stmt['quarter'] = sales_data['quarter']
-        income_stmt['total_revenue'] = sales_data['sales_units'] * sales_data['unit_price']
-        
-        # Cost of goods sold
-        cost_per_unit = sales_data['unit_price'] * 0.6
-        income_stmt['total_cogs'] = sales_data['sales_units'] * cost_per_unit
-        
-        # Gross profit
-        income_stmt['gross_profit'] = income_stmt['total_revenue'] - income_stmt['total_cogs']
-        
-        return income_stmt
+        total_revenue = sales_data['sales_revenue'].to_numpy()
+
+        # Cost of goods sold (cost per unit is 60% of selling price)
+        total_cogs = sales_data['sales_units'].to_numpy() * (sales_data['unit_price'].to_numpy() * 0.6)
+
+        return pd.DataFrame({
+            'quarter': sales_data['quarter'].to_numpy(),
+            'total_revenue': total_revenue,
+            'total_cogs': total_cogs,
+            'gross_profit': total_revenue - total_cogs
+        }, index=sales_data.index)
     
     def compute_balance_sheet(self, cash_budget: pd.DataFrame, purchases: pd.DataFrame, 
                             sales_data: pd.DataFrame) -> pd.DataFrame:
@@ -142,43 +217,37 @@ class BudgetCalculator:
             sales_data is None or sales_data.empty):
             return pd.DataFrame()
         
-        balance_sheet = pd.DataFrame()
-        balance_sheet['quarter'] = sales_data['quarter']
-        
         # Assets
-        balance_sheet['cash'] = cash_budget['ending_cash']
+        cash = cash_budget['ending_cash'].to_numpy(dtype=float)
         
         # Inventory value
-        inventory_value = purchases['desired_ending_inventory'] * (sales_data['unit_price'] * 0.6)
-        balance_sheet['inventory'] = inventory_value
+        inventory = (purchases['desired_ending_inventory'].to_numpy(dtype=float) *
+                     (sales_data['unit_price'].to_numpy(dtype=float) * 0.6))
         
         # Receivables (uncollected sales)
-        receivables = []
-        for i, row in sales_data.iterrows():
-            if i == 0:
-                receivables.append(row['sales_revenue'] * (1 - self.settings['sales_collection_current']))
-            else:
-                prev_uncollected = receivables[i-1]
-                current_uncollected = row['sales_revenue'] * (1 - self.settings['sales_collection_current'])
-                receivables.append(prev_uncollected + current_uncollected - 
-                                sales_data.loc[i-1, 'sales_revenue'] * self.settings['sales_collection_next'])
-        
-        balance_sheet['receivables'] = receivables
+        receivables = _receivables(
+            sales_data['sales_revenue'].to_numpy(dtype=float),
+            self.policy[COLLECT_CURRENT],
+            self.policy[COLLECT_NEXT]
+        )
         
         # Total assets
-        balance_sheet['total_assets'] = (balance_sheet['cash'] + 
-                                       balance_sheet['inventory'] + 
-                                       balance_sheet['receivables'])
+        total_assets = cash + inventory + receivables
         
         # Liabilities & Equity
         # External financing based on ratio
-        external_financing = balance_sheet['total_assets'] * self.settings['external_financing_ratio']
-        balance_sheet['external_financing'] = external_financing
+        external_financing = total_assets * self.policy[EXTERNAL_FINANCING]
         
         # Equity (plug figure)
-        balance_sheet['equity'] = balance_sheet['total_assets'] - balance_sheet['external_financing']
-        
-        balance_sheet['liabilities_equity'] = (balance_sheet['external_financing'] + 
-                                             balance_sheet['equity'])
-        
-        return balance_sheet 
\ No newline at end of file
+        equity = total_assets - external_financing
+        
+        return pd.DataFrame({
+            'quarter': sales_data['quarter'].to_numpy(),
+            'cash': cash,
+            'inventory': inventory,
+            'receivables': receivables,
+            'total_assets': total_assets,
+            'external_financing': external_financing,
+            'equity': equity,
+            'liabilities_equity': external_financing + equity
+        }, index=sales_data.index) 
\ No newline at end of file
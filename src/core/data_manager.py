@@ -3,38 +3,168 @@ Data management for CSV import/export and validation.
 """
 
 import pandas as pd
+import numpy as np
 import os
+import glob
+import hashlib
+import tempfile
 from datetime import datetime
-from typing import Optional, Tuple, List
+from contextlib import nullcontext
+from typing import Optional, Tuple, List, Iterator, Callable, ContextManager
+
+# Rows parsed at a time when reading CSV files with pandas
+CSV_CHUNK_ROWS = 50_000
+
+# Built once; get_sample_data hands out copies
+_SAMPLE_DATA = pd.DataFrame({
+    'quarter': ['Q1', 'Q2', 'Q3', 'Q4'],
+    'sales_units': [10000, 12000, 15000, 13000],
+    'unit_price': [20, 20, 20, 20]
+})
+
+# Feather copies of loaded CSV files, kept outside the working directory
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                 'quickbudget')
+
+# Least recently used copies beyond this many are deleted
+CSV_CACHE_MAX_FILES = 20
+
+# Reports longer than this are streamed to disk row by row
+STREAMING_MIN_ROWS = 5000
 
 
 class DataManager:
     """Handles data import, export, and validation."""
     
-    def __init__(self):
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
         self.required_columns = ['quarter', 'sales_units', 'unit_price']
+        self._required_set = frozenset(self.required_columns)
+        self.cache_dir = cache_dir
+    
+    def _cache_prefix(self, filename: str) -> str:
+        """Cache file prefix for a source path; the full name adds its modification time."""
+        digest = hashlib.md5(os.path.abspath(filename).encode(), usedforsecurity=False).hexdigest()
+        return os.path.join(self.cache_dir, digest)
+    
+    def _read_csv(self, filename: str, chunksize: int) -> Tuple[ContextManager[Iterator[pd.DataFrame]], Optional[str]]:
+        """
+        Parse a CSV file into one or more dataframe chunks.
+        
+        With pyarrow the whole file is parsed at once (or read back from a Feather copy
+        of an earlier load); otherwise pandas reads it in chunks of chunksize rows.
+        
+        Returns:
+            Tuple of (context manager yielding the chunks, cache file to write once
+            the data has been validated)
+        """
+        # Imported on first load rather than at application startup
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+            from pyarrow import feather
+        except ImportError:  # pyarrow is optional
+            # Quarter labels are always text; value columns are coerced during validation
+            return pd.read_csv(filename, usecols=lambda col: col in self._required_set,
+                               dtype={'quarter': str}, engine='c', chunksize=chunksize), None
+        
+        # Key the cache on path and modification time so edited files are re-parsed
+        cache_file = f"{self._cache_prefix(filename)}.{os.stat(filename).st_mtime_ns}.arrow"
+        try:
+            df = feather.read_feather(cache_file)
+            os.utime(cache_file)  # Mark as recently used
+            return nullcontext(iter([df])), None
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # A damaged copy is discarded and the CSV parsed again
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+        
+        # Report missing columns the same way as the pandas path instead of a pyarrow error
+        header = pd.read_csv(filename, nrows=0).columns
+        if not self._required_set.issubset(header):
+            return nullcontext(iter([pd.DataFrame(columns=header)])), None
+        
+        # Native multithreaded parser, limited to the required columns
+        convert_options = pa_csv.ConvertOptions(column_types={'quarter': pa.string()},
+                                                include_columns=self.required_columns)
+        df = pa_csv.read_csv(filename, convert_options=convert_options).to_pandas()
+        return nullcontext(iter([df])), cache_file
+    
+    def _write_cache(self, filename: str, cache_file: str, df: pd.DataFrame) -> None:
+        """Store validated data as Feather, replacing older copies of the same file."""
+        from pyarrow import feather
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for old_file in glob.glob(glob.escape(self._cache_prefix(filename)) + ".*.arrow"):
+                os.remove(old_file)
+            
+            # Write under a temporary name so a crash or a concurrent load never leaves a partial copy
+            fd, temp_file = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            os.close(fd)
+            try:
+                feather.write_feather(df, temp_file, compression='zstd')
+                os.replace(temp_file, cache_file)
+            except Exception:
+                os.remove(temp_file)
+                raise
+            
+            # Keep the cache bounded, dropping the least recently used copies
+            cached = sorted(glob.glob(os.path.join(glob.escape(self.cache_dir), "*.arrow")),
+                            key=os.path.getmtime)
+            for old_file in cached[:-CSV_CACHE_MAX_FILES]:
+                os.remove(old_file)
+        except Exception:
+            pass  # The cache only speeds up later loads
     
-    def load_csv(self, filename: str) -> Tuple[bool, Optional[pd.DataFrame], str]:
+    def load_csv(self, filename: str, chunksize: int = CSV_CHUNK_ROWS,
+                 progress: Optional[Callable[[int], None]] = None) -> Tuple[bool, Optional[pd.DataFrame], str]:
         """
         Load and validate CSV data.
         
+        Args:
+            filename: CSV file to load
+            chunksize: Rows parsed at a time when pandas does the parsing
+            progress: Called with the number of rows read after each chunk
+        
         Returns:
             Tuple of (success, dataframe, error_message)
         """
         try:
-            df = pd.read_csv(filename)
+            chunks = []
+            rows_read = 0
             
-            # Check required columns
-            if not all(col in df.columns for col in self.required_columns):
-                return False, None, f"CSV must contain columns: {', '.join(self.required_columns)}"
+            # Validate chunk by chunk so a bad file fails before the rest is parsed
+            reader, cache_file = self._read_csv(filename, chunksize)
+            # Closing the reader releases the file even when a chunk is rejected early
+            with reader as chunks_read:
+                for df in chunks_read:
+                    # Check required columns
+                    if not self._required_set.issubset(df.columns):
+                        return False, None, f"CSV must contain columns: {', '.join(self.required_columns)}"
+                    
+                    # Anything non-numeric becomes NaN, which then fails the positive-value check
+                    value_columns = ['sales_units', 'unit_price']
+                    df[value_columns] = df[value_columns].apply(pd.to_numeric, errors='coerce')
+                    
+                    is_valid, message = self.validate_data(df, first_row=rows_read + 1)
+                    if not is_valid:
+                        return False, None, message
+                    
+                    chunks.append(df)
+                    rows_read += len(df)
+                    if progress is not None:
+                        progress(rows_read)
             
-            # Validate data types and values
-            for _, row in df.iterrows():
-                if not (isinstance(row['sales_units'], (int, float)) and 
-                       isinstance(row['unit_price'], (int, float)) and
-                       row['sales_units'] > 0 and row['unit_price'] > 0):
-                    return False, None, "Sales units and unit price must be positive numbers"
+            if not chunks:
+                return False, None, "No data available"
             
+            df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+            if cache_file is not None:
+                self._write_cache(filename, cache_file, df)
             return True, df, ""
             
         except Exception as e:
@@ -52,29 +182,84 @@ class DataManager:
             Tuple of (success, message)
         """
         try:
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
+            os.makedirs(output_dir, exist_ok=True)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{output_dir}/budget_reports_{timestamp}.xlsx"
             
-            with pd.ExcelWriter(filename) as writer:
-                for sheet_name, df in dataframes.items():
-                    if not df.empty:
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+            # Empty reports are skipped; filter them once for whichever writer runs
+            sheets = [(sheet_name, df) for sheet_name, df in dataframes.items() if not df.empty]
+            
+            large = any(len(df) > STREAMING_MIN_ROWS for _, df in sheets)
+            if not (large and self._write_streaming(filename, sheets)):
+                self._write_workbook(filename, sheets)
             
             return True, f"Reports saved to {filename}"
             
         except Exception as e:
             return False, f"Error saving reports: {str(e)}"
     
-    def validate_data(self, df: pd.DataFrame) -> Tuple[bool, str]:
-        """Validate dataframe structure and content."""
+    def _write_streaming(self, filename: str, sheets: List[Tuple[str, pd.DataFrame]]) -> bool:
+        """Write sheets row by row in constant memory. Returns False if xlsxwriter is missing."""
+        try:
+            import xlsxwriter
+        except ImportError:  # xlsxwriter is optional
+            return False
+        
+        # constant_memory flushes each row once the next one starts, so rows must be
+        # written in order (pandas' to_excel writes column by column and cannot be used)
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'nan_inf_to_errors': True})
+        try:
+            for sheet_name, df in sheets:
+                # Text columns go in as plain str so each cell takes write_row's string path
+                text_columns = df.select_dtypes(include='object').columns
+                if len(text_columns):
+                    df = df.astype({col: str for col in text_columns})
+                
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, df.columns.tolist())
+                for row_num, row in enumerate(df.itertuples(index=False, name=None), 1):
+                    worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+        return True
+    
+    def _write_workbook(self, filename: str, sheets: List[Tuple[str, pd.DataFrame]]) -> None:
+        """Write sheets with pyexcelerate's bulk writer, else xlsxwriter, else pandas/openpyxl."""
+        # Imported on first export rather than at application startup
+        try:
+            from pyexcelerate import Workbook
+        except ImportError:  # pyexcelerate is optional
+            Workbook = None
+        
+        if Workbook is not None:
+            # Bulk-write each sheet in one call instead of cell by cell
+            workbook = Workbook()
+            for sheet_name, df in sheets:
+                workbook.new_sheet(sheet_name, data=[df.columns.tolist()] + df.values.tolist())
+            workbook.save(filename)
+        elif not self._write_streaming(filename, sheets):
+            with pd.ExcelWriter(filename) as writer:
+                for sheet_name, df in sheets:
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+    
+    def validate_data(self, df: pd.DataFrame, first_row: int = 1) -> Tuple[bool, str]:
+        """
+        Validate dataframe structure and content.
+        
+        Args:
+            df: Dataframe to validate
+            first_row: Row number of the first row in df, used in error messages
+        
+        Returns:
+            Tuple of (is_valid, message)
+        """
         if df is None or df.empty:
             return False, "No data available"
         
         # Check for required columns
-        missing_cols = [col for col in self.required_columns if col not in df.columns]
+        missing = self._required_set.difference(df.columns)
+        missing_cols = [col for col in self.required_columns if col in missing]
         if missing_cols:
             return False, f"Missing required columns: {', '.join(missing_cols)}"
         
@@ -83,16 +268,15 @@ class DataManager:
             if not pd.api.types.is_numeric_dtype(df[col]):
                 return False, f"Column '{col}' must contain numeric values"
         
-        # Check for positive values
-        if (df['sales_units'] <= 0).any() or (df['unit_price'] <= 0).any():
-            return False, "Sales units and unit price must be positive numbers"
+        # Check for positive values (missing values, including pd.NA, count as invalid)
+        values = df[['sales_units', 'unit_price']].to_numpy(dtype=float, na_value=np.nan)
+        valid_rows = (values > 0).all(axis=1)
+        if not valid_rows.all():
+            bad_row = first_row + valid_rows.argmin()
+            return False, f"Sales units and unit price must be positive numbers (row {bad_row})"
         
         return True, "Data validation passed"
     
     def get_sample_data(self) -> pd.DataFrame:
         """Return sample data for testing."""
-        return pd.DataFrame({
-            'quarter': ['Q1', 'Q2', 'Q3', 'Q4'],
-            'sales_units': [10000, 12000, 15000, 13000],
-            'unit_price': [20, 20, 20, 20]
-        }) 
\ No newline at end of file
+        return _SAMPLE_DATA.copy() 
\ No newline at end of file
@@ -2,9 +2,37 @@
 Settings management for application configuration.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Mapping
 import json
-import os
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+if orjson is not None:
+    def _encode_json(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _decode_json = orjson.loads
+else:
+    # Shared across calls; json.dumps(indent=...) would build a new encoder every time
+    _JSON_ENCODER = json.JSONEncoder(indent=2)
+    _JSON_DECODER = json.JSONDecoder()
+    
+    def _encode_json(obj: Any) -> bytes:
+        return _JSON_ENCODER.encode(obj).encode('utf-8')
+    
+    def _decode_json(data: bytes) -> Any:
+        return _JSON_DECODER.decode(data.decode('utf-8'))
+
+# Settings expressed as a fraction between 0 and 1
+PERCENTAGE_SETTINGS = frozenset({
+    'sales_collection_current', 'sales_collection_next',
+    'purchases_payment_current', 'purchases_payment_next',
+    'ending_inventory_pct', 'external_financing_ratio'
+})
 
 
 class SettingsManager:
@@ -22,6 +50,15 @@ class SettingsManager:
             'beginning_cash': 100000
         }
         self.settings = self.default_settings.copy()
+        self._custom_keys = set()  # Keys whose value differs from the default
+    
+    def _store(self, key: str, value: float) -> None:
+        """Write one setting, tracking whether it differs from its default."""
+        self.settings[key] = value
+        if value != self.default_settings[key]:
+            self._custom_keys.add(key)
+        else:
+            self._custom_keys.discard(key)
     
     def get_setting(self, key: str) -> float:
         """Get a setting value."""
@@ -29,31 +66,49 @@ class SettingsManager:
     
     def set_setting(self, key: str, value: float) -> bool:
         """Set a setting value."""
-        try:
-            if key in self.default_settings:
-                self.settings[key] = float(value)
-                return True
-            return False
-        except (ValueError, TypeError):
+        if key not in self.default_settings:
             return False
+        
+        # Floats are stored as-is; anything else is coerced
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
+                return False
+        
+        self._store(key, value)
+        return True
     
-    def get_all_settings(self) -> Dict[str, float]:
-        """Get all current settings."""
-        return self.settings.copy()
+    def get_all_settings(self, copy: bool = False) -> Mapping[str, float]:
+        """
+        Get all current settings.
+        
+        Args:
+            copy: Return an independent dict instead of a live read-only view
+        """
+        if copy:
+            return self.settings.copy()
+        return MappingProxyType(self.settings)
     
     def update_settings(self, new_settings: Dict[str, float]) -> bool:
         """Update multiple settings at once."""
         try:
-            for key, value in new_settings.items():
-                if key in self.default_settings:
-                    self.settings[key] = float(value)
-            return True
+            # Coerce every known key before writing so a bad value leaves settings untouched
+            valid_keys = new_settings.keys() & self.default_settings.keys()
+            coerced = {key: float(new_settings[key]) for key in valid_keys}
         except (ValueError, TypeError):
             return False
+        
+        for key, value in coerced.items():
+            self._store(key, value)
+        return True
     
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values."""
-        self.settings = self.default_settings.copy()
+        # Update in place so views returned by get_all_settings stay current
+        self.settings.clear()
+        self.settings.update(self.default_settings)
+        self._custom_keys.clear()
     
     def validate_settings(self) -> Tuple[bool, str]:
         """Validate current settings."""
@@ -63,17 +118,8 @@ class SettingsManager:
                     return False, f"Setting '{key}' must be a number"
                 if value < 0:
                     return False, f"Setting '{key}' must be non-negative"
-            
-            # Validate percentage settings
-            percentage_settings = [
-                'sales_collection_current', 'sales_collection_next',
-                'purchases_payment_current', 'purchases_payment_next',
-                'ending_inventory_pct', 'external_financing_ratio'
-            ]
-            
-            for setting in percentage_settings:
-                if self.settings[setting] > 1.0:
-                    return False, f"Setting '{setting}' must be between 0 and 1"
+                if key in PERCENTAGE_SETTINGS and value > 1.0:
+                    return False, f"Setting '{key}' must be between 0 and 1"
             
             return True, "Settings validation passed"
             
@@ -83,8 +129,9 @@ class SettingsManager:
     def save_to_file(self, filename: str = "settings.json") -> bool:
         """Save settings to JSON file."""
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Serialize first so the file gets a single write() instead of one per token
+            with open(filename, 'wb') as f:
+                f.write(_encode_json(self.settings))
             return True
         except Exception:
             return False
@@ -92,23 +139,21 @@ class SettingsManager:
     def load_from_file(self, filename: str = "settings.json") -> bool:
         """Load settings from JSON file."""
         try:
-            if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    loaded_settings = json.load(f)
-                
-                # Validate loaded settings
-                for key, value in loaded_settings.items():
-                    if key in self.default_settings:
-                        self.settings[key] = float(value)
-                return True
-            return False
-        except Exception:
+            with open(filename, 'rb') as f:
+                loaded_settings = _decode_json(f.read())
+            
+            # Validate loaded settings
+            for key, value in loaded_settings.items():
+                if key in self.default_settings:
+                    self._store(key, float(value))
+            return True
+        except Exception:  # Includes a missing file
             return False
     
     def get_settings_summary(self) -> Dict[str, Any]:
         """Get a summary of current settings."""
         return {
             'total_settings': len(self.settings),
-            'settings': self.settings.copy(),
-            'has_custom_values': self.settings != self.default_settings
+            'settings': MappingProxyType(self.settings),
+            'has_custom_values': bool(self._custom_keys)
         } 
\ No newline at end of file
@@ -4,18 +4,81 @@ Main application window and GUI components.
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import pandas as pd
+from collections import namedtuple
+from itertools import islice
+from pandas.api.types import is_numeric_dtype
 from typing import Optional, Dict, Any
 
 from ..core import BudgetCalculator, DataManager, SettingsManager
 from .language_manager import LanguageManager
 
+# Editable policy settings, in display order
+SETTINGS_KEYS = (
+    'sales_collection_current',
+    'sales_collection_next',
+    'purchases_payment_current',
+    'purchases_payment_next',
+    'ending_inventory_pct',
+    'external_financing_ratio',
+    'working_capital_turnover',
+    'beginning_cash'
+)
+
+# Delay before a language selection is applied, collapsing repeated combobox events
+LANGUAGE_DEBOUNCE_MS = 100
+
+# Every schedule produced from one set of inputs
+Results = namedtuple('Results', 'sales collections purchases cash income balance')
+
+# Data table columns, used as both Treeview column ids and language keys
+TREE_COLUMNS = ('quarter', 'sales_units', 'unit_price')
+
+# Rows added to the data table at a time; more are inserted as it is scrolled
+TREE_PAGE_ROWS = 1000
+
+
+def _df_to_text(df) -> str:
+    """Format a report as fixed-width text, numbers to two decimals."""
+    header_fmt = []
+    row_fmt = []
+    for col in df.columns:
+        values = df[col]
+        if is_numeric_dtype(values):
+            width = max(len(str(col)), len(f"{values.abs().max():.2f}") + 1, 12)
+            row_fmt.append(f"%{width}.2f")
+        else:
+            width = max(len(str(col)), values.astype(str).str.len().max(), 12)
+            row_fmt.append(f"%{width}s")
+        header_fmt.append(f"%{width}s")
+    
+    header_fmt = " ".join(header_fmt)
+    row_fmt = " ".join(row_fmt)
+    lines = [header_fmt % tuple(df.columns)]
+    lines.extend(row_fmt % row for row in df.itertuples(index=False, name=None))
+    return "\n".join(lines)
+
 
 class MainWindow:
     """Main application window."""
     
+    # (ui_elements key, language key) for every widget whose text is translated
+    _LABEL_BINDINGS = (
+        ('lang_label', 'language'),
+        ('budget_data_label', 'budget_data'),
+        ('policy_parameters_label', 'policy_parameters'),
+        ('application_settings_label', 'application_settings'),
+        ('results_label', 'results'),
+        ('load_csv_button', 'load_csv'),
+        ('save_settings_button', 'save_settings'),
+        ('generate_cash_button', 'generate_cash'),
+        ('generate_income_button', 'generate_income'),
+        ('generate_balance_button', 'generate_balance'),
+        ('save_reports_button', 'save_reports')
+    )
+    
     def __init__(self):
         self.root = ttk.Window(themename="flatly")
         self.root.title("Master Budget Application")
@@ -25,11 +88,16 @@ class MainWindow:
         self.language_manager = LanguageManager()
         self.data_manager = DataManager()
         self.settings_manager = SettingsManager()
-        self.budget_calculator = BudgetCalculator(self.settings_manager.get_all_settings())
+        self.budget_calculator = BudgetCalculator(self.settings_manager.get_all_settings(copy=True))
         
         # Data storage
         self.data = None
         self.setting_vars = {}
+        # Results of _compute_all; cleared when data is loaded or settings are saved
+        self._results_cache = None
+        self._pending_tree_rows = None  # Rows not yet inserted into the data table
+        self.last_csv_dir = None  # Reopened by the CSV file dialog
+        self._lang_after = None  # Pending debounced language change
         
         # UI elements for language updates
         self.ui_elements = {}
@@ -41,6 +109,10 @@ class MainWindow:
     
     def setup_ui(self):
         """Setup the main user interface."""
+        # Resolve every label once for this build instead of per widget
+        self.texts = self.language_manager.get_text_table()
+        self._last_texts = self.texts
+        
         # Top bar with language selector
         self.create_top_bar()
         
@@ -52,14 +124,25 @@ class MainWindow:
         self.create_inputs_tab()
         self.create_settings_tab()
         self.create_results_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
+    
+    def _on_tab_change(self, event=None):
+        """Build the settings and results tabs the first time they are shown."""
+        current = self.notebook.index("current")
+        if current == 1 and not self._settings_built:
+            self._build_settings_tab_body()
+        elif current == 2 and not self._results_built:
+            self._build_results_tab_body()
     
     def create_top_bar(self):
         """Create the top bar with language selector."""
+        t = self.texts
+        
         top_frame = ttk.Frame(self.root)
         top_frame.pack(fill=X, padx=10, pady=5)
         
         # Language label
-        lang_label = ttk.Label(top_frame, text=self.language_manager.get_text("language"), 
+        lang_label = ttk.Label(top_frame, text=t["language"], 
                               font=("Segoe UI", 11))
         lang_label.pack(side=RIGHT, padx=(0,5))
         self.ui_elements['lang_label'] = lang_label
@@ -74,34 +157,34 @@ class MainWindow:
     
     def create_inputs_tab(self):
         """Create the inputs tab."""
+        t = self.texts
+        
         self.inputs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.inputs_frame, text=self.language_manager.get_text("inputs"))
+        self.notebook.add(self.inputs_frame, text=t["inputs"])
         
         # Left side - Data table
         left_frame = ttk.Frame(self.inputs_frame)
         left_frame.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0,10))
         
         # Budget data label
-        budget_label = ttk.Label(left_frame, text=self.language_manager.get_text("budget_data"), 
+        budget_label = ttk.Label(left_frame, text=t["budget_data"], 
                                 font=("Segoe UI", 14, "bold"))
         budget_label.pack(anchor=W, pady=(0,10))
         self.ui_elements['budget_data_label'] = budget_label
         
-        # Table
-        columns = (self.language_manager.get_text("quarter"), 
-                  self.language_manager.get_text("sales_units"), 
-                  self.language_manager.get_text("unit_price"))
-        self.tree = ttk.Treeview(left_frame, columns=columns, show="headings", height=6)
+        # Table; column ids are the data column names, headings are translated
+        self.tree = ttk.Treeview(left_frame, columns=TREE_COLUMNS, show="headings", height=6,
+                                 yscrollcommand=self._on_tree_scroll)
         
-        for col in columns:
-            self.tree.heading(col, text=col)
+        for col in TREE_COLUMNS:
+            self.tree.heading(col, text=t[col])
             self.tree.column(col, width=100, anchor=CENTER)
         
         self.tree.pack(fill=BOTH, expand=YES)
         self.ui_elements['tree'] = self.tree
         
         # Load CSV button
-        load_button = ttk.Button(left_frame, text=self.language_manager.get_text("load_csv"), 
+        load_button = ttk.Button(left_frame, text=t["load_csv"], 
                                 command=self.load_csv, bootstyle="primary")
         load_button.pack(pady=10)
         self.ui_elements['load_csv_button'] = load_button
@@ -111,120 +194,98 @@ class MainWindow:
         right_frame.pack(side=RIGHT, fill=Y, padx=(10,0))
         
         # Policy parameters label
-        policy_label = ttk.Label(right_frame, text=self.language_manager.get_text("policy_parameters"), 
+        policy_label = ttk.Label(right_frame, text=t["policy_parameters"], 
                                 font=("Segoe UI", 14, "bold"))
         policy_label.pack(anchor=W, pady=(0,10))
         self.ui_elements['policy_parameters_label'] = policy_label
         
         # Settings inputs for inputs tab
-        self.create_inputs_settings(right_frame)
-    
-    def create_inputs_settings(self, parent):
-        """Create input fields for settings in the inputs tab."""
-        settings_list = [
-            ('sales_collection_current', self.language_manager.get_text("sales_collection_current")),
-            ('sales_collection_next', self.language_manager.get_text("sales_collection_next")),
-            ('purchases_payment_current', self.language_manager.get_text("purchases_payment_current")),
-            ('purchases_payment_next', self.language_manager.get_text("purchases_payment_next")),
-            ('ending_inventory_pct', self.language_manager.get_text("ending_inventory_pct")),
-            ('external_financing_ratio', self.language_manager.get_text("external_financing_ratio")),
-            ('working_capital_turnover', self.language_manager.get_text("working_capital_turnover")),
-            ('beginning_cash', self.language_manager.get_text("beginning_cash"))
-        ]
-        
-        for setting, label in settings_list:
-            frame = ttk.Frame(parent)
-            frame.pack(fill=X, pady=2)
-            
-            label_widget = ttk.Label(frame, text=f"{label}:", font=("Segoe UI", 10))
-            label_widget.pack(anchor=W)
-            self.inputs_setting_labels[setting] = label_widget
-            
-            # Create variable with default value
-            default_value = self.settings_manager.get_setting(setting)
-            var = tk.StringVar(value=f"{default_value:.2f}" if isinstance(default_value, float) else str(default_value))
-            self.setting_vars[setting] = var
-            ttk.Entry(frame, textvariable=var, width=15).pack(anchor=W, pady=(2,0))
+        self._build_settings_panel(right_frame, self.inputs_setting_labels)
     
-    def create_settings_inputs(self, parent):
-        """Create input fields for settings in the settings tab."""
-        settings_list = [
-            ('sales_collection_current', self.language_manager.get_text("sales_collection_current")),
-            ('sales_collection_next', self.language_manager.get_text("sales_collection_next")),
-            ('purchases_payment_current', self.language_manager.get_text("purchases_payment_current")),
-            ('purchases_payment_next', self.language_manager.get_text("purchases_payment_next")),
-            ('ending_inventory_pct', self.language_manager.get_text("ending_inventory_pct")),
-            ('external_financing_ratio', self.language_manager.get_text("external_financing_ratio")),
-            ('working_capital_turnover', self.language_manager.get_text("working_capital_turnover")),
-            ('beginning_cash', self.language_manager.get_text("beginning_cash"))
-        ]
-        
-        for setting, label in settings_list:
+    def _build_settings_panel(self, parent, label_store):
+        """Create input fields for settings, recording their labels in label_store."""
+        t = self.texts
+        
+        for setting in SETTINGS_KEYS:
             frame = ttk.Frame(parent)
             frame.pack(fill=X, pady=2)
             
-            label_widget = ttk.Label(frame, text=f"{label}:", font=("Segoe UI", 10))
+            label_widget = ttk.Label(frame, text=f"{t[setting]}:", font=("Segoe UI", 10))
             label_widget.pack(anchor=W)
-            self.setting_labels[setting] = label_widget
+            label_store[setting] = label_widget
             
-            # Create variable with default value
-            default_value = self.settings_manager.get_setting(setting)
-            var = tk.StringVar(value=f"{default_value:.2f}" if isinstance(default_value, float) else str(default_value))
-            self.setting_vars[setting] = var
+            # Entries for the same setting on both tabs share one variable
+            var = self.setting_vars.get(setting)
+            if var is None:
+                value = self.settings_manager.get_setting(setting)
+                var = tk.StringVar(value=f"{value:.2f}" if isinstance(value, float) else str(value))
+                self.setting_vars[setting] = var
             ttk.Entry(frame, textvariable=var, width=15).pack(anchor=W, pady=(2,0))
     
     def create_settings_tab(self):
-        """Create the settings tab."""
+        """Create the settings tab; its contents are built when first selected."""
         self.settings_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.settings_frame, text=self.language_manager.get_text("settings"))
+        self.notebook.add(self.settings_frame, text=self.texts["settings"])
+        self._settings_built = False
+    
+    def _build_settings_tab_body(self):
+        """Build the widgets of the settings tab."""
+        t = self.texts
+        self._settings_built = True
         
         # Application settings label
-        settings_label = ttk.Label(self.settings_frame, text=self.language_manager.get_text("application_settings"), 
+        settings_label = ttk.Label(self.settings_frame, text=t["application_settings"], 
                                   font=("Segoe UI", 16, "bold"))
         settings_label.pack(anchor=W, pady=(0,20))
         self.ui_elements['application_settings_label'] = settings_label
         
         # Create settings inputs
-        self.create_settings_inputs(self.settings_frame)
+        self._build_settings_panel(self.settings_frame, self.setting_labels)
         
         # Save settings button
-        save_button = ttk.Button(self.settings_frame, text=self.language_manager.get_text("save_settings"), 
+        save_button = ttk.Button(self.settings_frame, text=t["save_settings"], 
                                 command=self.save_settings, bootstyle="success")
         save_button.pack(pady=20)
         self.ui_elements['save_settings_button'] = save_button
     
     def create_results_tab(self):
-        """Create the results tab."""
+        """Create the results tab; its contents are built when first selected."""
         self.results_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.results_frame, text=self.language_manager.get_text("results"))
+        self.notebook.add(self.results_frame, text=self.texts["results"])
+        self._results_built = False
+    
+    def _build_results_tab_body(self):
+        """Build the widgets of the results tab."""
+        t = self.texts
+        self._results_built = True
         
         # Buttons frame
         buttons_frame = ttk.Frame(self.results_frame)
         buttons_frame.pack(fill=X, pady=(0,20))
         
         # Generate buttons
-        cash_button = ttk.Button(buttons_frame, text=self.language_manager.get_text("generate_cash"), 
+        cash_button = ttk.Button(buttons_frame, text=t["generate_cash"], 
                                 command=self.generate_cash_budget, bootstyle="success")
         cash_button.pack(side=LEFT, padx=(0,10))
         self.ui_elements['generate_cash_button'] = cash_button
         
-        income_button = ttk.Button(buttons_frame, text=self.language_manager.get_text("generate_income"), 
+        income_button = ttk.Button(buttons_frame, text=t["generate_income"], 
                                   command=self.generate_income_statement, bootstyle="info")
         income_button.pack(side=LEFT, padx=(0,10))
         self.ui_elements['generate_income_button'] = income_button
         
-        balance_button = ttk.Button(buttons_frame, text=self.language_manager.get_text("generate_balance"), 
+        balance_button = ttk.Button(buttons_frame, text=t["generate_balance"], 
                                    command=self.generate_balance_sheet, bootstyle="warning")
         balance_button.pack(side=LEFT, padx=(0,10))
         self.ui_elements['generate_balance_button'] = balance_button
         
-        save_reports_button = ttk.Button(buttons_frame, text=self.language_manager.get_text("save_reports"), 
+        save_reports_button = ttk.Button(buttons_frame, text=t["save_reports"], 
                                         command=self.save_all_reports, bootstyle="danger")
         save_reports_button.pack(side=LEFT)
         self.ui_elements['save_reports_button'] = save_reports_button
         
         # Results display
-        results_label = ttk.Label(self.results_frame, text=self.language_manager.get_text("results"), 
+        results_label = ttk.Label(self.results_frame, text=t["results"], 
                                  font=("Segoe UI", 14, "bold"))
         results_label.pack(anchor=W, pady=(0,10))
         self.ui_elements['results_label'] = results_label
@@ -232,142 +293,174 @@ class MainWindow:
         # Text area for results
         self.results_text = tk.Text(self.results_frame, height=20, width=80, font=("Consolas", 10))
         scrollbar = ttk.Scrollbar(self.results_frame, orient=VERTICAL, command=self.results_text.yview)
-        self.results_text.configure(yscrollcommand=scrollbar.set)
+        # Read-only except while a report is written (see show_report)
+        self.results_text.configure(yscrollcommand=scrollbar.set, state=DISABLED)
         
         self.results_text.pack(side=LEFT, fill=BOTH, expand=YES)
         scrollbar.pack(side=RIGHT, fill=Y)
     
     def update_ui_language(self):
         """Update all UI elements with the current language."""
-        # Update window title
-        self.root.title(self.language_manager.get_text("title"))
-        
-        # Update notebook tabs
-        self.notebook.tab(0, text=self.language_manager.get_text("inputs"))
-        self.notebook.tab(1, text=self.language_manager.get_text("settings"))
-        self.notebook.tab(2, text=self.language_manager.get_text("results"))
-        
-        # Update labels
-        if 'lang_label' in self.ui_elements:
-            self.ui_elements['lang_label'].config(text=self.language_manager.get_text("language"))
-        
-        if 'budget_data_label' in self.ui_elements:
-            self.ui_elements['budget_data_label'].config(text=self.language_manager.get_text("budget_data"))
+        # Fetch every label in one batch and only reconfigure widgets whose text changed.
+        # Tabs not built yet have no entries in ui_elements or the label dicts, and pick up
+        # the current language from self.texts when they are built.
+        last = self._last_texts
+        t = self.language_manager.get_texts(last)
         
-        if 'policy_parameters_label' in self.ui_elements:
-            self.ui_elements['policy_parameters_label'].config(text=self.language_manager.get_text("policy_parameters"))
+        def changed(key):
+            return t[key] != last.get(key)
         
-        if 'application_settings_label' in self.ui_elements:
-            self.ui_elements['application_settings_label'].config(text=self.language_manager.get_text("application_settings"))
-        
-        if 'results_label' in self.ui_elements:
-            self.ui_elements['results_label'].config(text=self.language_manager.get_text("results"))
-        
-        # Update buttons
-        if 'load_csv_button' in self.ui_elements:
-            self.ui_elements['load_csv_button'].config(text=self.language_manager.get_text("load_csv"))
-        
-        if 'save_settings_button' in self.ui_elements:
-            self.ui_elements['save_settings_button'].config(text=self.language_manager.get_text("save_settings"))
-        
-        if 'generate_cash_button' in self.ui_elements:
-            self.ui_elements['generate_cash_button'].config(text=self.language_manager.get_text("generate_cash"))
-        
-        if 'generate_income_button' in self.ui_elements:
-            self.ui_elements['generate_income_button'].config(text=self.language_manager.get_text("generate_income"))
-        
-        if 'generate_balance_button' in self.ui_elements:
-            self.ui_elements['generate_balance_button'].config(text=self.language_manager.get_text("generate_balance"))
-        
-        if 'save_reports_button' in self.ui_elements:
-            self.ui_elements['save_reports_button'].config(text=self.language_manager.get_text("save_reports"))
+        # Update window title
+        self.root.title(t["title"])
         
-        # Update tree columns
-        if 'tree' in self.ui_elements:
-            tree = self.ui_elements['tree']
-            # Clear existing columns
-            for col in tree['columns']:
-                tree.heading(col, text="")
-            
-            # Set new columns
-            new_columns = (self.language_manager.get_text("quarter"), 
-                          self.language_manager.get_text("sales_units"), 
-                          self.language_manager.get_text("unit_price"))
-            tree['columns'] = new_columns
-            
-            for col in new_columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=100, anchor=CENTER)
-        
-        # Update setting labels in inputs tab
-        settings_list = [
-            ('sales_collection_current', self.language_manager.get_text("sales_collection_current")),
-            ('sales_collection_next', self.language_manager.get_text("sales_collection_next")),
-            ('purchases_payment_current', self.language_manager.get_text("purchases_payment_current")),
-            ('purchases_payment_next', self.language_manager.get_text("purchases_payment_next")),
-            ('ending_inventory_pct', self.language_manager.get_text("ending_inventory_pct")),
-            ('external_financing_ratio', self.language_manager.get_text("external_financing_ratio")),
-            ('working_capital_turnover', self.language_manager.get_text("working_capital_turnover")),
-            ('beginning_cash', self.language_manager.get_text("beginning_cash"))
-        ]
-        
-        # Update inputs tab setting labels
-        for setting, label in settings_list:
-            if setting in self.inputs_setting_labels:
-                self.inputs_setting_labels[setting].config(text=f"{label}:")
-        
-        # Update settings tab setting labels
-        for setting, label in settings_list:
-            if setting in self.setting_labels:
-                self.setting_labels[setting].config(text=f"{label}:")
+        # Update notebook tabs
+        for index, key in enumerate(("inputs", "settings", "results")):
+            if changed(key):
+                self.notebook.tab(index, text=t[key])
+        
+        # Update labels and buttons
+        for ui_key, lang_key in self._LABEL_BINDINGS:
+            widget = self.ui_elements.get(ui_key)
+            if widget is not None and changed(lang_key):
+                widget.config(text=t[lang_key])
+        
+        # Update tree column headings
+        tree = self.ui_elements.get('tree')
+        if tree is not None:
+            for col in TREE_COLUMNS:
+                if changed(col):
+                    tree.heading(col, text=t[col])
+        
+        # Update setting labels on the inputs and settings tabs
+        for setting in SETTINGS_KEYS:
+            if changed(setting):
+                label = f"{t[setting]}:"
+                if setting in self.inputs_setting_labels:
+                    self.inputs_setting_labels[setting].config(text=label)
+                if setting in self.setting_labels:
+                    self.setting_labels[setting].config(text=label)
+        
+        self.texts = self._last_texts = t
     
     def change_language(self, event=None):
-        """Change the application language."""
+        """Change the application language once the selection settles."""
+        # The combobox can fire several times per interaction; only apply the last one
+        if self._lang_after is not None:
+            self.root.after_cancel(self._lang_after)
+        self._lang_after = self.root.after(LANGUAGE_DEBOUNCE_MS, self._apply_language)
+    
+    def _apply_language(self):
+        """Switch to the selected language if it differs from the current one."""
+        self._lang_after = None
         new_language = self.lang_var.get()
+        if new_language == self.language_manager.get_current_language():
+            return
         if self.language_manager.set_language(new_language):
             self.update_ui_language()
     
     def load_csv(self):
         """Load CSV file."""
         filename = filedialog.askopenfilename(
+            parent=self.root,
             title="Select CSV File",
+            initialdir=self.last_csv_dir,
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
         if filename:
-            success, df, error_msg = self.data_manager.load_csv(filename)
+            # Let the window repaint between chunks of a large file
+            success, df, error_msg = self.data_manager.load_csv(
+                filename, progress=lambda rows: self.root.update_idletasks())
             
             if success:
                 self.data = df
+                self.last_csv_dir = os.path.dirname(filename)
+                self._invalidate_calculations()
                 
                 # Update table
-                for item in self.tree.get_children():
-                    self.tree.delete(item)
+                children = self.tree.get_children()
+                if children:
+                    self.tree.delete(*children)
                 
-                for _, row in df.iterrows():
-                    self.tree.insert("", END, values=(row['quarter'], row['sales_units'], row['unit_price']))
+                self._pending_tree_rows = df[list(TREE_COLUMNS)].itertuples(
+                    index=False, name=None)
+                self.insert_tree_rows()
                 
                 messagebox.showinfo(self.language_manager.get_text("success"), "CSV file loaded successfully!")
             else:
                 messagebox.showerror(self.language_manager.get_text("error"), error_msg)
     
+    def insert_tree_rows(self):
+        """Insert the next page of loaded rows into the data table."""
+        if self._pending_tree_rows is None:
+            return
+        
+        # Hide the columns while inserting so Tk lays the table out once, not per row
+        self.tree.configure(displaycolumns=())
+        try:
+            inserted = 0
+            for values in islice(self._pending_tree_rows, TREE_PAGE_ROWS):
+                self.tree.insert("", END, values=values)
+                inserted += 1
+        finally:
+            self.tree.configure(displaycolumns="#all")
+        
+        if inserted < TREE_PAGE_ROWS:
+            self._pending_tree_rows = None
+    
+    def _on_tree_scroll(self, first, last):
+        """Load more rows once the data table is scrolled to the bottom."""
+        if self._pending_tree_rows is not None and float(last) >= 1.0:
+            self.insert_tree_rows()
+    
     def save_settings(self):
         """Save application settings."""
-        try:
-            new_settings = {}
-            for setting, var in self.setting_vars.items():
-                new_settings[setting] = float(var.get())
-            
-            if self.settings_manager.update_settings(new_settings):
-                self.budget_calculator = BudgetCalculator(self.settings_manager.get_all_settings())
-                messagebox.showinfo(self.language_manager.get_text("success"), 
-                                 self.language_manager.get_text("settings_saved"))
-            else:
-                messagebox.showerror(self.language_manager.get_text("error"), 
-                                  self.language_manager.get_text("invalid_settings"))
-        except ValueError:
+        # Read every entry first, then report all invalid fields together
+        raw = {setting: var.get() for setting, var in self.setting_vars.items()}
+        new_settings = {}
+        errors = []
+        for setting, text in raw.items():
+            try:
+                new_settings[setting] = float(text)
+            except ValueError:
+                errors.append(f"{self.texts[setting]}: {text!r}")
+        
+        if not errors and self.settings_manager.update_settings(new_settings):
+            self.budget_calculator = BudgetCalculator(self.settings_manager.get_all_settings(copy=True))
+            self._invalidate_calculations()
+            messagebox.showinfo(self.language_manager.get_text("success"), 
+                             self.language_manager.get_text("settings_saved"))
+        else:
             messagebox.showerror(self.language_manager.get_text("error"), 
-                              self.language_manager.get_text("invalid_settings"))
+                              "\n".join([self.language_manager.get_text("invalid_settings"), *errors]))
+    
+    def _invalidate_calculations(self):
+        """Drop cached schedules after the data or settings change."""
+        self._results_cache = None
+    
+    def _compute_all(self):
+        """Run the whole budget pipeline for the current data and settings."""
+        calc = self.budget_calculator
+        sales = calc.compute_sales_revenue(self.data)
+        collections = calc.compute_collections(sales)
+        purchases = calc.compute_purchases(sales)
+        cash = calc.compute_cash_budget(collections, purchases)
+        income = calc.compute_income_statement(sales)
+        balance = calc.compute_balance_sheet(cash, purchases, sales)
+        return Results(sales, collections, purchases, cash, income, balance)
+    
+    def _results(self):
+        """Every schedule for the current inputs, computed once until they change."""
+        if self._results_cache is None:
+            self._results_cache = self._compute_all()
+        return self._results_cache
+    
+    def show_report(self, title, report):
+        """Replace the results area with a formatted report."""
+        self.results_text.configure(state=NORMAL)
+        self.results_text.delete(1.0, END)
+        self.results_text.insert(END, f"{title}:\n\n{_df_to_text(report)}")
+        self.results_text.configure(state=DISABLED)
     
     def generate_cash_budget(self):
         """Generate cash budget."""
@@ -377,15 +470,10 @@ class MainWindow:
         
         try:
             # Calculate cash budget
-            sales_data = self.budget_calculator.compute_sales_revenue(self.data)
-            collections = self.budget_calculator.compute_collections(sales_data)
-            purchases = self.budget_calculator.compute_purchases(sales_data)
-            cash_budget = self.budget_calculator.compute_cash_budget(collections, purchases)
+            cash_budget = self._results().cash
             
             # Display results
-            self.results_text.delete(1.0, END)
-            self.results_text.insert(END, "Cash Budget:\n\n")
-            self.results_text.insert(END, cash_budget.to_string(index=False))
+            self.show_report("Cash Budget", cash_budget)
             
         except Exception as e:
             messagebox.showerror(self.language_manager.get_text("error"), f"Error generating cash budget: {str(e)}")
@@ -398,13 +486,10 @@ class MainWindow:
         
         try:
             # Calculate income statement
-            sales_data = self.budget_calculator.compute_sales_revenue(self.data)
-            income_stmt = self.budget_calculator.compute_income_statement(sales_data)
+            income_stmt = self._results().income
             
             # Display results
-            self.results_text.delete(1.0, END)
-            self.results_text.insert(END, "Income Statement:\n\n")
-            self.results_text.insert(END, income_stmt.to_string(index=False))
+            self.show_report("Income Statement", income_stmt)
             
         except Exception as e:
             messagebox.showerror(self.language_manager.get_text("error"), f"Error generating income statement: {str(e)}")
@@ -417,16 +502,10 @@ class MainWindow:
         
         try:
             # Calculate balance sheet
-            sales_data = self.budget_calculator.compute_sales_revenue(self.data)
-            collections = self.budget_calculator.compute_collections(sales_data)
-            purchases = self.budget_calculator.compute_purchases(sales_data)
-            cash_budget = self.budget_calculator.compute_cash_budget(collections, purchases)
-            balance_sheet = self.budget_calculator.compute_balance_sheet(cash_budget, purchases, sales_data)
+            balance_sheet = self._results().balance
             
             # Display results
-            self.results_text.delete(1.0, END)
-            self.results_text.insert(END, "Balance Sheet:\n\n")
-            self.results_text.insert(END, balance_sheet.to_string(index=False))
+            self.show_report("Balance Sheet", balance_sheet)
             
         except Exception as e:
             messagebox.showerror(self.language_manager.get_text("error"), f"Error generating balance sheet: {str(e)}")
@@ -438,19 +517,12 @@ class MainWindow:
             return
         
         try:
-            # Generate all reports
-            sales_data = self.budget_calculator.compute_sales_revenue(self.data)
-            collections = self.budget_calculator.compute_collections(sales_data)
-            purchases = self.budget_calculator.compute_purchases(sales_data)
-            cash_budget = self.budget_calculator.compute_cash_budget(collections, purchases)
-            income_stmt = self.budget_calculator.compute_income_statement(sales_data)
-            balance_sheet = self.budget_calculator.compute_balance_sheet(cash_budget, purchases, sales_data)
-            
-            # Prepare dataframes for export
+            # Prepare dataframes for export (reports already shown are reused)
+            results = self._results()
             dataframes = {
-                'Cash Budget': cash_budget,
-                'Income Statement': income_stmt,
-                'Balance Sheet': balance_sheet
+                'Cash Budget': results.cash,
+                'Income Statement': results.income,
+                'Balance Sheet': results.balance
             }
             
             # Export to Excel